@@ -0,0 +1,23 @@
+import asyncio
+
+from fastapi import Request
+
+from app.services.pdf_processor import PDFProcessor
+from app.services.status_store import StatusStore
+from app.services.vector_store import VectorStore
+
+
+def get_pdf_processor(request: Request) -> PDFProcessor:
+    return request.app.state.pdf_processor
+
+
+def get_vector_store(request: Request) -> VectorStore:
+    return request.app.state.vector_store
+
+
+def get_status_store(request: Request) -> StatusStore:
+    return request.app.state.status_store
+
+
+def get_pdf_queue(request: Request) -> asyncio.Queue:
+    return request.app.state.pdf_queue
@@ -1,50 +1,81 @@
-import shutil
+import asyncio
 import os
-from fastapi import APIRouter, UploadFile, File, BackgroundTasks, HTTPException, Depends
+import aiofiles
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from sse_starlette.sse import EventSourceResponse
 from typing import List
 import uuid
-from ..models.document import DocumentResponse, ProcessingStatus, ProcessingResponse
-from ..services.pdf_processor import PDFProcessor
-from ..services.vector_store import VectorStore
-from ..core.config import get_settings, Settings
+from app.api.dependencies import (
+    get_pdf_processor,
+    get_pdf_queue,
+    get_status_store,
+    get_vector_store,
+)
+from app.models.document import DocumentResponse, ProcessingStatus, ProcessingResponse
+from app.services.pdf_processor import PDFProcessor
+from app.services.status_store import StatusStore
+from app.services.vector_store import VectorStore
+from app.utils.keyed_lock import KeyedLock
 
 router = APIRouter()
 
-# Store upload status
-processing_status = {}
+# Serializes processing per doc_id so retries/duplicate enqueues cannot
+# race status writes or double-upsert into Pinecone
+_doc_locks = KeyedLock()
 
 
 async def process_document(
     file_path: str,
     doc_id: str,
     pdf_processor: PDFProcessor,
-    vector_store: VectorStore
+    vector_store: VectorStore,
+    status_store: StatusStore
 ):
     """Background task to process uploaded PDF"""
-    try:
-        # Update status to processing
-        processing_status[doc_id] = ProcessingStatus.PROCESSING
-        
-        # Process PDF
-        chunks = await pdf_processor.process_pdf(file_path)
-        
-        # Store in vector database
-        await vector_store.upsert_documents(chunks)
-        
-        # Update status to completed
-        processing_status[doc_id] = ProcessingStatus.COMPLETED
-        
-    except Exception as e:
-        processing_status[doc_id] = ProcessingStatus.FAILED
-        print(f"Error processing document: {str(e)}")
-        raise
+    async with _doc_locks(doc_id):
+        # Duplicate enqueue or retry: nothing left to do
+        if await status_store.get(doc_id) == ProcessingStatus.COMPLETED:
+            return
+
+        try:
+            # Update status to processing
+            await status_store.set(doc_id, ProcessingStatus.PROCESSING)
+
+            # Process PDF; the processor's async surface keeps the
+            # CPU-bound stages off the event loop thread
+            chunks = await pdf_processor.aprocess_pdf(file_path)
+
+            # Store in vector database
+            await vector_store.upsert_documents(chunks)
+
+            # Update status to completed
+            await status_store.set(doc_id, ProcessingStatus.COMPLETED)
+
+        except Exception as e:
+            await status_store.set(doc_id, ProcessingStatus.FAILED)
+            print(f"Error processing document: {str(e)}")
+            raise
+
+
+async def document_worker(queue: asyncio.Queue):
+    """Worker task that drains the PDF processing queue one job at a time"""
+    while True:
+        job = await queue.get()
+        try:
+            await process_document(**job)
+        except Exception as e:
+            print(f"Worker error for document {job['doc_id']}: {str(e)}")
+        finally:
+            queue.task_done()
 
 
 @router.post("/upload", response_model=DocumentResponse)
 async def upload_document(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    settings: Settings = Depends(get_settings)
+    pdf_processor: PDFProcessor = Depends(get_pdf_processor),
+    vector_store: VectorStore = Depends(get_vector_store),
+    status_store: StatusStore = Depends(get_status_store),
+    pdf_queue: asyncio.Queue = Depends(get_pdf_queue),
 ):
     """
     Upload and process a PDF document
@@ -59,28 +90,36 @@ async def upload_document(
     upload_dir = "uploads"
     os.makedirs(upload_dir, exist_ok=True)
     
-    # Save the uploaded file
+    # Save the uploaded file without blocking the event loop,
+    # so concurrent uploads can proceed on a single worker
     file_path = os.path.join(upload_dir, f"{doc_id}.pdf")
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(1024 * 1024):
+                await buffer.write(chunk)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
+    finally:
+        await file.close()
     
-    # Initialize services
-    pdf_processor = PDFProcessor(settings)
-    vector_store = VectorStore(settings)
-    
-    # Add document processing to background tasks
-    processing_status[doc_id] = ProcessingStatus.PENDING
-    background_tasks.add_task(
-        process_document,
-        file_path,
-        doc_id,
-        pdf_processor,
-        vector_store
-    )
-    
+    # Enqueue for the worker pool; reject with backpressure when full
+    await status_store.set(doc_id, ProcessingStatus.PENDING)
+    try:
+        pdf_queue.put_nowait({
+            "file_path": file_path,
+            "doc_id": doc_id,
+            "pdf_processor": pdf_processor,
+            "vector_store": vector_store,
+            "status_store": status_store,
+        })
+    except asyncio.QueueFull:
+        await status_store.delete(doc_id)
+        raise HTTPException(
+            status_code=503,
+            detail="Document processing queue is full, please retry later",
+            headers={"Retry-After": "30"},
+        )
+
     return DocumentResponse(
         id=doc_id,
         status=ProcessingStatus.PENDING,
@@ -89,15 +128,37 @@ async def upload_document(
 
 
 @router.get("/status/{doc_id}", response_model=ProcessingResponse)
-async def get_processing_status(doc_id: str):
+async def get_processing_status(
+    doc_id: str,
+    status_store: StatusStore = Depends(get_status_store),
+):
     """
     Get the processing status of a document
     """
-    if doc_id not in processing_status:
+    status = await status_store.get(doc_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Document not found")
-    
-    status = processing_status[doc_id]
+
     return ProcessingResponse(
         status=status,
         message=f"Document processing {status}"
     )
+
+
+@router.get("/status/{doc_id}/stream")
+async def stream_processing_status(
+    doc_id: str,
+    status_store: StatusStore = Depends(get_status_store),
+):
+    """
+    Stream status transitions for a document as server-sent events,
+    so clients don't need to poll the status endpoint
+    """
+    if await status_store.get(doc_id) is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    async def event_source():
+        async for status in status_store.watch(doc_id):
+            yield {"event": "status", "data": status.value}
+
+    return EventSourceResponse(event_source())
@@ -17,10 +17,17 @@ class Settings(BaseSettings):
     PINECONE_API_KEY: str
     PINECONE_ENVIRONMENT: str = "gcp-starter"
     PINECONE_INDEX_NAME: str = "hogwarts-index"
+    PINECONE_UPSERT_BATCH_SIZE: int = 100
+    PINECONE_UPSERT_CONCURRENCY: int = 8
+
+    # Redis Configuration
+    REDIS_URL: str = "redis://localhost:6379/0"
     
     # Document Processing
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
+    PDF_QUEUE_MAX_SIZE: int = 50
+    PDF_WORKER_COUNT: int = 2
     
     # Character Settings
     DEFAULT_CHARACTERS: list[str] = [
@@ -1,8 +1,14 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import get_settings
 from .core.logging import setup_logging
 from .api.routes import api_router
+from .api.routes.document import document_worker
+from .services.pdf_processor import PDFProcessor
+from .services.status_store import StatusStore
+from .services.vector_store import VectorStore
 
 # Setup logging
 setup_logging()
@@ -30,3 +36,26 @@ if settings.BACKEND_CORS_ORIGINS:
 
 # Include all routers
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+
+@app.on_event("startup")
+async def start_document_workers():
+    # Shared service instances and a bounded queue drained by a fixed
+    # number of workers, so a burst of uploads cannot exhaust memory
+    app.state.pdf_processor = PDFProcessor(
+        chunk_size=settings.CHUNK_SIZE,
+        chunk_overlap=settings.CHUNK_OVERLAP,
+    )
+    app.state.vector_store = VectorStore(settings)
+    app.state.status_store = StatusStore(settings)
+    app.state.pdf_queue = asyncio.Queue(maxsize=settings.PDF_QUEUE_MAX_SIZE)
+    app.state.pdf_workers = [
+        asyncio.create_task(document_worker(app.state.pdf_queue))
+        for _ in range(settings.PDF_WORKER_COUNT)
+    ]
+
+
+@app.on_event("shutdown")
+async def stop_document_workers():
+    for worker in app.state.pdf_workers:
+        worker.cancel()
@@ -0,0 +1,138 @@
+"""
+Recursive character chunking hot loop, compiled with Numba when available.
+
+The splitter works on UTF-8 byte offsets and prefers to break on the
+default separator hierarchy (paragraph break, newline, space) before
+falling back to a hard cut. Separator positions are located up-front
+with vectorized NumPy compares — one SIMD pass per separator class over
+the whole buffer — so the kernel only binary-searches small index
+arrays instead of re-scanning bytes for every chunk. Only integers
+cross the kernel boundary; substrings are materialized in Python
+afterwards, so the loop compiles to machine code under Numba's
+nopython mode and falls back to plain Python otherwise.
+"""
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+_NEWLINE = 0x0A
+_SPACE = 0x20
+
+
+def _split_kernel_py(buf, chunk_size, overlap, para_idx, nl_idx, sp_idx):
+    """
+    Compute (start, end) byte spans for each chunk, returned as an
+    (n, 2) int64 array.
+
+    para_idx/nl_idx/sp_idx are sorted byte positions of the second
+    newline of each "\n\n" pair, every newline, and every space. Each
+    chunk boundary is the largest position of the best separator class
+    inside the allowed window, found by binary search.
+
+    Kept inside the Numba nopython subset: byte/index arithmetic only.
+    The span array is sized up-front from the nominal stride so the
+    common case never reallocates; degenerate strides double it.
+    """
+    n = buf.shape[0]
+    step = chunk_size - overlap
+    if step < 1:
+        step = 1
+    cap = n // step + 2
+    spans = np.empty((cap, 2), dtype=np.int64)
+    count = 0
+    start = 0
+    while start < n:
+        if count == cap:
+            cap *= 2
+            grown = np.empty((cap, 2), dtype=np.int64)
+            grown[:count] = spans
+            spans = grown
+        end = start + chunk_size
+        if end >= n:
+            spans[count, 0] = start
+            spans[count, 1] = n
+            count += 1
+            break
+
+        # Break on the best separator whose byte sits in
+        # [floor, end - 1]: never shrink the chunk below half its size.
+        # searchsorted(idx, end) counts positions < end, so idx[j - 1]
+        # is the rightmost candidate
+        floor = start + chunk_size // 2
+        cut = -1
+        j = np.searchsorted(para_idx, end)
+        if j > 0 and para_idx[j - 1] >= floor:
+            cut = para_idx[j - 1]
+        else:
+            j = np.searchsorted(nl_idx, end)
+            if j > 0 and nl_idx[j - 1] >= floor:
+                cut = nl_idx[j - 1]
+            else:
+                j = np.searchsorted(sp_idx, end)
+                if j > 0 and sp_idx[j - 1] >= floor:
+                    cut = sp_idx[j - 1]
+
+        if cut != -1:
+            end = cut + 1
+        else:
+            # Hard cut: back off continuation bytes so the boundary
+            # never lands inside a multi-byte UTF-8 sequence
+            while end > start + 1 and (buf[end] & 0xC0) == 0x80:
+                end -= 1
+
+        spans[count, 0] = start
+        spans[count, 1] = end
+        count += 1
+
+        next_start = end - overlap
+        if next_start <= start:
+            next_start = start + 1
+        while next_start < n and (buf[next_start] & 0xC0) == 0x80:
+            next_start += 1
+        start = next_start
+
+    return spans[:count]
+
+
+# Prefer the ahead-of-time compiled kernel (built by
+# scripts/build_native.py) so the first call pays no JIT warmup; fall
+# back to JIT compilation, then to plain Python
+try:
+    from app.services._chunker_native import split_overlap as _split_kernel
+except ImportError:
+    if njit is not None:
+        _split_kernel = njit(cache=True, nogil=True)(_split_kernel_py)
+    else:
+        _split_kernel = _split_kernel_py
+
+
+def split_text(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size bytes with the given
+    overlap, breaking on paragraph/newline/space boundaries when possible.
+    """
+    if not text or not text.strip():
+        return []
+
+    data = text.encode("utf-8")
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    # One vectorized compare per separator class; the kernel then only
+    # binary-searches these sorted position arrays
+    nl_idx = np.flatnonzero(buf == _NEWLINE).astype(np.int64)
+    para_idx = nl_idx[1:][np.diff(nl_idx) == 1]
+    sp_idx = np.flatnonzero(buf == _SPACE).astype(np.int64)
+
+    spans = _split_kernel(buf, chunk_size, chunk_overlap, para_idx, nl_idx, sp_idx)
+
+    chunks = []
+    for i in range(spans.shape[0]):
+        piece = data[spans[i, 0]:spans[i, 1]].decode("utf-8").strip()
+        if piece:
+            chunks.append(piece)
+    return chunks
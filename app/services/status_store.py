@@ -0,0 +1,68 @@
+from typing import AsyncIterator, Optional
+import redis.asyncio as redis
+from app.core.config import Settings
+from app.models.document import ProcessingStatus
+
+# Keep finished statuses around for a day so clients can poll after restart
+STATUS_TTL_SECONDS = 86400
+
+
+class StatusStore:
+    """
+    Redis-backed store for document processing status.
+
+    An in-process dict breaks under multi-worker uvicorn (a status poll
+    can hit a worker that never saw the upload) and grows unboundedly;
+    Redis with a TTL gives every worker the same view and caps memory.
+    """
+
+    def __init__(self, settings: Settings):
+        self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    @staticmethod
+    def _key(doc_id: str) -> str:
+        return f"doc:{doc_id}:status"
+
+    @staticmethod
+    def _channel(doc_id: str) -> str:
+        return f"doc:{doc_id}:events"
+
+    async def set(self, doc_id: str, status: ProcessingStatus) -> None:
+        await self._redis.set(self._key(doc_id), status.value, ex=STATUS_TTL_SECONDS)
+        # Push the transition to any streaming subscribers
+        await self._redis.publish(self._channel(doc_id), status.value)
+
+    async def get(self, doc_id: str) -> Optional[ProcessingStatus]:
+        value = await self._redis.get(self._key(doc_id))
+        return ProcessingStatus(value) if value is not None else None
+
+    async def delete(self, doc_id: str) -> None:
+        await self._redis.delete(self._key(doc_id))
+
+    async def watch(self, doc_id: str) -> AsyncIterator[ProcessingStatus]:
+        """
+        Yield status transitions for a document as they happen,
+        ending once the document reaches a terminal state.
+        """
+        terminal = (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED)
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._channel(doc_id))
+        try:
+            # Emit the current status first so subscribers don't miss
+            # transitions that happened before they connected
+            current = await self.get(doc_id)
+            if current is not None:
+                yield current
+                if current in terminal:
+                    return
+
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                status = ProcessingStatus(message["data"])
+                yield status
+                if status in terminal:
+                    return
+        finally:
+            await pubsub.unsubscribe(self._channel(doc_id))
+            await pubsub.close()
@@ -1,5 +1,6 @@
+import asyncio
 from typing import List, Dict, Optional
-from pinecone import Pinecone, ServerlessSpec
+from pinecone import Pinecone, PineconeAsyncio, ServerlessSpec
 from langchain.schema import Document
 from app.core.config import Settings
 
@@ -10,6 +11,8 @@ class VectorStore:
         self.pc = Pinecone(api_key=settings.PINECONE_API_KEY)
         self.index_name = settings.PINECONE_INDEX_NAME
         self._ensure_index_exists()
+        self._index_host = self.pc.describe_index(self.index_name).host
+        self._index = self.pc.Index(self.index_name)
 
     def _ensure_index_exists(self):
         """
@@ -30,41 +33,82 @@ class VectorStore:
                 )
             )
 
+    @staticmethod
+    def _make_vector(i: int, doc: Document) -> Dict:
+        return {
+            "id": f"doc_{i}",
+            "text": doc.page_content,
+            "metadata": {
+                **doc.metadata,
+                "chunk_id": i
+            }
+        }
+
+    @staticmethod
+    async def _auto_batch(vectors, batch_size: int, max_delay: float = 0.05):
+        """
+        Group a vector generator into batches, flushing when a batch
+        fills or max_delay elapses, so the first upsert can leave while
+        later vectors are still being built.
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        deadline = None
+
+        for vector in vectors:
+            if deadline is None:
+                deadline = loop.time() + max_delay
+            batch.append(vector)
+            if len(batch) >= batch_size or loop.time() >= deadline:
+                yield batch
+                batch = []
+                deadline = None
+                # Give in-flight upserts a chance to run between batches
+                await asyncio.sleep(0)
+
+        if batch:
+            yield batch
+
     async def upsert_documents(self, documents: List[Document]) -> Dict:
         """
         Upsert documents into Pinecone index.
         Latest version of Pinecone handles embeddings automatically.
-        
+
         Args:
             documents: List of Document objects containing text and metadata
-            
+
         Returns:
             Dictionary with upsert status
         """
-        index = self.pc.Index(self.index_name)
-        
-        # Prepare documents for upsert
-        vectors = []
-        for i, doc in enumerate(documents):
-            vectors.append({
-                "id": f"doc_{i}",
-                "text": doc.page_content,
-                "metadata": {
-                    **doc.metadata,
-                    "chunk_id": i
-                }
-            })
-        
-        # Upsert in batches
-        batch_size = 100
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i:i + batch_size]
-            try:
-                index.upsert(vectors=batch)
-            except Exception as e:
-                print(f"Error upserting batch {i//batch_size}: {str(e)}")
-                raise
-        
+        # Build vectors lazily so the full payload never sits in memory
+        # alongside the source documents
+        vector_source = (
+            self._make_vector(i, doc) for i, doc in enumerate(documents)
+        )
+
+        # Fire batches concurrently through the async client; the
+        # semaphore bounds how many round-trips are in flight at once
+        batch_size = self.settings.PINECONE_UPSERT_BATCH_SIZE
+        semaphore = asyncio.Semaphore(self.settings.PINECONE_UPSERT_CONCURRENCY)
+
+        async with PineconeAsyncio(api_key=self.settings.PINECONE_API_KEY) as pc:
+            async with pc.IndexAsyncio(host=self._index_host) as index:
+
+                async def upsert_batch(batch_index: int, batch: List[Dict]):
+                    async with semaphore:
+                        try:
+                            await index.upsert(vectors=batch)
+                        except Exception as e:
+                            print(f"Error upserting batch {batch_index}: {str(e)}")
+                            raise
+
+                in_flight = []
+                async for batch in self._auto_batch(vector_source, batch_size):
+                    in_flight.append(asyncio.create_task(
+                        upsert_batch(len(in_flight), batch)
+                    ))
+                await asyncio.gather(*in_flight)
+
         return {"status": "success", "documents_processed": len(documents)}
 
     async def query(
@@ -84,13 +128,11 @@ class VectorStore:
         Returns:
             List of relevant documents with scores
         """
-        index = self.pc.Index(self.index_name)
-        
         # Prepare filter if character is specified
         filter_dict = {"character": character} if character else None
-        
+
         # Query the index
-        results = index.query(
+        results = self._index.query(
             query_texts=[query_text],
             top_k=top_k,
             filter=filter_dict
@@ -0,0 +1,47 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Hashable, List
+
+
+class KeyedLock:
+    """
+    Async lock keyed by an arbitrary hashable value.
+
+    Locks are pooled and refcounted: a key borrows a lock while it has
+    holders or waiters and returns it to the pool once the last one
+    releases, so a long-running service does not accumulate one Lock
+    object per key it has ever seen.
+    """
+
+    def __init__(self, pool_size: int = 32):
+        self._pool: Deque[asyncio.Lock] = deque(
+            asyncio.Lock() for _ in range(pool_size)
+        )
+        # key -> [lock, refcount]
+        self._active: Dict[Hashable, List] = {}
+
+    def _borrow(self, key: Hashable) -> asyncio.Lock:
+        entry = self._active.get(key)
+        if entry is None:
+            lock = self._pool.pop() if self._pool else asyncio.Lock()
+            entry = [lock, 0]
+            self._active[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+    def _release(self, key: Hashable) -> None:
+        entry = self._active[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._active[key]
+            self._pool.append(entry[0])
+
+    @asynccontextmanager
+    async def __call__(self, key: Hashable):
+        lock = self._borrow(key)
+        try:
+            async with lock:
+                yield
+        finally:
+            self._release(key)
@@ -1,29 +1,52 @@
 import re
 from typing import List
 
+# Compiled once at import so repeated calls skip pattern lookup entirely
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_HYPHEN_NEWLINE = re.compile(r'(\w+)-\n(\w+)')
+_RE_HYPHEN_SPACE = re.compile(r'([a-z])- ([a-z])')
+_RE_FORM_FEED = re.compile(r'\f')
+_RE_MULTI_NEWLINE = re.compile(r'\n\s*\n')
+_RE_CHAPTER_HEADER = re.compile(r'^chapter\s+(\d+|[ivxlcdm]+)', re.IGNORECASE)
+
+MAIN_CHARACTERS = [
+    "Harry", "Potter", "Ron", "Weasley",
+    "Hermione", "Granger", "Draco", "Malfoy",
+    "Dumbledore", "Snape", "McGonagall", "Hagrid"
+]
+
+# One alternation scans the text once for every character name
+_RE_CHARACTERS = re.compile(
+    r'\b(' + '|'.join(map(re.escape, MAIN_CHARACTERS)) + r')\b',
+    re.IGNORECASE,
+)
+
+# Map case-insensitive matches back to their canonical spelling
+_CHARACTER_CANONICAL = {name.lower(): name for name in MAIN_CHARACTERS}
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize text from PDF
-    
+
     Args:
         text: Raw text extracted from PDF
-    
+
     Returns:
         Cleaned and normalized text
     """
     # Remove multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-    
+    text = _RE_WHITESPACE.sub(' ', text)
+
     # Remove hyphenation at end of lines
-    text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
-    
+    text = _RE_HYPHEN_NEWLINE.sub(r'\1\2', text)
+
     # Fix common PDF extraction issues
-    text = re.sub(r'([a-z])- ([a-z])', r'\1\2', text)  # Fix wrong hyphenation
-    text = re.sub(r'\f', ' ', text)  # Remove form feeds
-    
+    text = _RE_HYPHEN_SPACE.sub(r'\1\2', text)  # Fix wrong hyphenation
+    text = _RE_FORM_FEED.sub(' ', text)  # Remove form feeds
+
     # Remove multiple newlines
-    text = re.sub(r'\n\s*\n', '\n', text)
-    
+    text = _RE_MULTI_NEWLINE.sub('\n', text)
+
     return text.strip()
 
 def is_chapter_header(text: str) -> bool:
@@ -36,13 +59,7 @@ def is_chapter_header(text: str) -> bool:
     Returns:
         True if line appears to be a chapter header
     """
-    chapter_patterns = [
-        r'^chapter\s+\d+',
-        r'^chapter\s+[ivxlcdm]+',
-    ]
-    
-    text = text.lower().strip()
-    return any(re.match(pattern, text) for pattern in chapter_patterns)
+    return _RE_CHAPTER_HEADER.match(text.strip()) is not None
 
 def extract_metadata(text: str, page_num: int) -> dict:
     """
@@ -72,15 +89,7 @@ def extract_character_mentions(text: str) -> List[str]:
     Returns:
         List of character names found
     """
-    main_characters = [
-        "Harry", "Potter", "Ron", "Weasley",
-        "Hermione", "Granger", "Draco", "Malfoy",
-        "Dumbledore", "Snape", "McGonagall", "Hagrid"
-    ]
-    
-    mentions = []
-    for character in main_characters:
-        if character.lower() in text.lower():
-            mentions.append(character)
-            
-    return list(set(mentions))
+    return list({
+        _CHARACTER_CANONICAL[match.group(1).lower()]
+        for match in _RE_CHARACTERS.finditer(text)
+    })
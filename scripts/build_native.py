@@ -0,0 +1,31 @@
+"""
+Ahead-of-time compile the chunking kernel with numba.pycc.
+
+The first call to an @njit function pays 0.5-2s of JIT compilation,
+which lands on whichever request (or test) happens to chunk a document
+first. Running this script at build/deploy time produces
+app/services/_chunker_native.*.so, which chunker.py imports in
+preference to the JIT path so no process ever compiles at runtime.
+
+Usage:
+    python scripts/build_native.py
+"""
+from pathlib import Path
+import sys
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_REPO_ROOT))
+
+from numba.pycc import CC
+
+from app.services.chunker import _split_kernel_py
+
+cc = CC("_chunker_native")
+cc.output_dir = str(_REPO_ROOT / "app" / "services")
+cc.export(
+    "split_overlap", "i8[:,:](u1[:], i8, i8, i8[:], i8[:], i8[:])"
+)(_split_kernel_py)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"built _chunker_native in {cc.output_dir}")
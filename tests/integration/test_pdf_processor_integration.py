@@ -4,13 +4,18 @@ from pathlib import Path
 import json
 from app.services.pdf_processor import PDFProcessor
 
-@pytest.fixture
+# Resolved once at import; the lekl101.pdf sample lives in the project root
+_SAMPLE_PDF = Path(__file__).resolve().parents[2] / "lekl101.pdf"
+
+@pytest.fixture(scope="session")
 def pdf_processor():
     return PDFProcessor()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_path():
-    return Path(__file__).parent.parent.parent / "lekl101.pdf"
+    if not _SAMPLE_PDF.exists():
+        pytest.skip("sample PDF not bundled")
+    return _SAMPLE_PDF
 
 def test_complete_pdf_processing_workflow(pdf_processor, sample_pdf_path, tmp_path):
     """Test the complete workflow of processing a PDF and saving results."""
@@ -59,12 +64,13 @@ def test_complete_pdf_processing_workflow(pdf_processor, sample_pdf_path, tmp_pa
     assert saved_data == result
     
     # 9. Check chunk content characteristics
-    total_text = ""
+    chunk_texts = []
     for chunk in chunks:
         chunk_text = chunk["content"]
         # Verify chunk size is within expected range
         assert len(chunk_text) <= pdf_processor.chunk_size + pdf_processor.chunk_overlap
-        total_text += chunk_text
+        chunk_texts.append(chunk_text)
+    total_text = "".join(chunk_texts)
     
     # 10. Verify total content is substantial
     assert len(total_text) > 0
@@ -0,0 +1,17 @@
+"""Smoke tests that the FastAPI app imports and wires its routes."""
+import os
+
+# Settings requires these at import time; values are never used because
+# startup (which would connect to Redis/Pinecone) is not run here
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("PINECONE_API_KEY", "test-key")
+
+from app.main import app  # noqa: E402
+
+
+def test_app_imports_and_exposes_document_routes():
+    """A broken import anywhere in the route tree fails this at collection."""
+    paths = {route.path for route in app.routes}
+    assert "/api/v1/documents/upload" in paths
+    assert "/api/v1/documents/status/{doc_id}" in paths
+    assert "/api/v1/documents/status/{doc_id}/stream" in paths
@@ -0,0 +1,68 @@
+"""Unit tests for the byte-span chunking kernel."""
+from app.services.chunker import split_text
+
+
+def test_empty_and_whitespace_input():
+    assert split_text("", 100, 20) == []
+    assert split_text("   \n\n  ", 100, 20) == []
+
+
+def test_chunks_respect_byte_size_bound():
+    text = ("word " * 400 + "\n\n") * 10
+    chunks = split_text(text, 1000, 200)
+    assert chunks
+    for chunk in chunks:
+        assert len(chunk.encode("utf-8")) <= 1000
+
+
+def test_all_content_is_preserved():
+    text = "\n\n".join(f"paragraph {i} with some words" for i in range(50))
+    chunks = split_text(text, 100, 0)
+    joined = "\n".join(chunks)
+    for i in range(50):
+        assert f"paragraph {i} with some words" in joined
+
+
+def test_prefers_paragraph_break_over_newline_and_space():
+    # The paragraph break sits in the back half of the window, so the
+    # first chunk should end exactly at it even though later newlines
+    # and spaces are closer to the size limit
+    text = "a" * 60 + "\n\n" + "b" * 20 + "\n" + "c c c c " + "d" * 60
+    chunks = split_text(text, 100, 0)
+    assert chunks[0] == "a" * 60
+
+
+def test_falls_back_to_newline_then_space():
+    text = "a" * 70 + "\n" + "b b b " + "c" * 60
+    chunks = split_text(text, 100, 0)
+    assert chunks[0] == "a" * 70
+
+    text = "a" * 70 + " " + "b" * 60
+    chunks = split_text(text, 100, 0)
+    assert chunks[0] == "a" * 70
+
+
+def test_hard_cut_never_splits_multibyte_sequences():
+    # No separators at all: boundaries must back off to character
+    # starts for 2-byte (é) and 4-byte (emoji) sequences alike
+    for text in ["é" * 500, "\U0001F600" * 300, ("xé\U0001F600" * 200)]:
+        chunks = split_text(text, 97, 13)
+        assert chunks
+        for chunk in chunks:
+            assert len(chunk.encode("utf-8")) <= 97
+            chunk.encode("utf-8").decode("utf-8")  # round-trips cleanly
+
+
+def test_degenerate_overlap_terminates():
+    # overlap >= chunk_size would stall a naive stride; the kernel must
+    # still advance and finish
+    chunks = split_text("abcdef" * 200, 10, 10)
+    assert chunks
+    assert all(len(c.encode("utf-8")) <= 10 for c in chunks)
+
+
+def test_overlap_advances_by_size_minus_overlap():
+    # 300 bytes with a stride of 80 covers [0,100), [80,180), [160,260),
+    # [240,300)
+    chunks = split_text("x" * 300, 100, 20)
+    assert [len(c) for c in chunks] == [100, 100, 100, 60]
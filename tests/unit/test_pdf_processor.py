@@ -3,14 +3,18 @@ import pytest
 from pathlib import Path
 from app.services.pdf_processor import PDFProcessor
 
-@pytest.fixture
+# Resolved once at import; the lekl101.pdf sample lives in the project root
+_SAMPLE_PDF = Path(__file__).resolve().parents[2] / "lekl101.pdf"
+
+@pytest.fixture(scope="session")
 def pdf_processor():
     return PDFProcessor()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_path():
-    # Use the leki101.pdf from the project root
-    return Path(__file__).parent.parent.parent / "lekl101.pdf"
+    if not _SAMPLE_PDF.exists():
+        pytest.skip("sample PDF not bundled")
+    return _SAMPLE_PDF
 
 def test_pdf_processor_initialization(pdf_processor):
     """Test PDFProcessor initialization with default parameters."""